@@ -3,7 +3,7 @@
 Metadata Collection Script for EKS Job Predictions
 
 This script collects metadata from:
-- EKS cluster (kubectl)
+- EKS cluster (Kubernetes API)
 - AWS services (boto3)
 - Job execution logs
 - Application metrics
@@ -11,30 +11,261 @@ This script collects metadata from:
 Stores data in JSON format for AI model training.
 """
 
-import json
-import subprocess
+import functools
+import re
+import threading
+import time
 import boto3
-from datetime import datetime, timedelta
-from typing import Dict, List, Any
+import orjson
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Any, Optional
 import logging
 
+from kubernetes import client, config, watch
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared botocore settings: a larger keep-alive connection pool so concurrent
+# collectors reuse TLS connections instead of opening new ones per burst
+AWS_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    connect_timeout=5,
+    read_timeout=30
+)
+
+# Worker threads used to describe relevant S3 buckets; each worker makes its
+# calls one after another, so this is also the cap on in-flight S3 requests
+S3_DESCRIBE_WORKERS = 8
+
+# Worker threads used to describe node groups and EFS mount targets
+EKS_DESCRIBE_WORKERS = 8
+EFS_DESCRIBE_WORKERS = 8
+
+# Connections kept alive to the Kubernetes API server (shared by all collectors)
+K8S_MAX_POOL_CONNECTIONS = 50
+
+# Jobs fetched per page when listing from the API server
+JOB_LIST_PAGE_SIZE = 500
+
+# Full job re-list that heals events missed by the job watch, and the
+# back-off before a dropped watch stream is reopened
+JOB_RECONCILE_INTERVAL_SECONDS = 60
+JOB_WATCH_RETRY_SECONDS = 5
+
+# Cluster metadata (ARN, version) rarely changes; reuse it for 6 minutes
+CLUSTER_INFO_TTL_SECONDS = 360
+
+# Bucket regions and IAM role policies change even less often
+STATIC_METADATA_TTL_SECONDS = 3600
+
+# Kubernetes resource quantities as reported by the metrics API (e.g. 250m,
+# 1532Ki, 1e3): a signed decimal with an optional exponent or unit suffix
+QUANTITY_RE = re.compile(r'([+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)([a-zA-Z]*)')
+QUANTITY_MULTIPLIERS = {
+    '': 1, 'n': 1e-9, 'u': 1e-6, 'm': 1e-3,
+    'k': 1e3, 'M': 1e6, 'G': 1e9, 'T': 1e12, 'P': 1e15, 'E': 1e18,
+    'Ki': 1024, 'Mi': 1024**2, 'Gi': 1024**3, 'Ti': 1024**4, 'Pi': 1024**5, 'Ei': 1024**6
+}
+
+
+def parse_quantity(quantity: str) -> float:
+    """Convert a Kubernetes quantity string to a float in base units"""
+    match = QUANTITY_RE.fullmatch(quantity)
+    if not match or match.group(2) not in QUANTITY_MULTIPLIERS:
+        raise ValueError(f"Unsupported quantity: {quantity}")
+
+    return float(match.group(1)) * QUANTITY_MULTIPLIERS[match.group(2)]
+
+
+class MetadataCache:
+    """Small JSON file cache of slow-changing metadata with per-entry timestamps"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+        try:
+            with open(self.path, 'rb') as f:
+                self._entries = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            self._entries = {}
+
+    def get(self, key: str, ttl: float) -> Any:
+        """Return the cached value for key, or None if missing or older than ttl seconds"""
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry and time.time() - entry[0] < ttl:
+            return entry[1]
+        return None
+
+    def set(self, key: str, value: Any):
+        """Store a JSON-serializable value and persist the cache file"""
+        with self._lock:
+            self._entries[key] = [time.time(), value]
+
+            try:
+                with open(self.path, 'wb') as f:
+                    f.write(orjson.dumps(self._entries))
+            except OSError as e:
+                logger.warning(f"Could not write metadata cache {self.path}: {e}")
+
+
+def ttl_cache(ttl: float):
+    """Cache a MetadataCollector method's result in its MetadataCache for ttl seconds
+
+    Entries are keyed by cluster name, region, method name and positional
+    arguments. The wrapped method must return a JSON-serializable value.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args):
+            cache_key = ':'.join([self.cluster_name, self.region, func.__name__, *map(str, args)])
+            value = self.cache.get(cache_key, ttl)
+
+            if value is None:
+                value = func(self, *args)
+                self.cache.set(cache_key, value)
+
+            return value
+        return wrapper
+    return decorator
+
 
 class MetadataCollector:
     """Collects metadata from EKS and AWS for job predictions"""
 
-    def __init__(self, cluster_name: str, region: str = 'us-east-1'):
+    def __init__(self, cluster_name: str, region: str = 'us-east-1', cache_file: str = '_cache.json'):
         self.cluster_name = cluster_name
         self.region = region
+        self.cache = MetadataCache(cache_file)
+
+        # Initialize AWS clients from one session
+        session = boto3.session.Session(region_name=region)
+        self.eks_client = session.client('eks', config=AWS_CLIENT_CONFIG)
+        self.ec2_client = session.client('ec2', config=AWS_CLIENT_CONFIG)
+        self.efs_client = session.client('efs', config=AWS_CLIENT_CONFIG)
+        self.iam_client = session.client('iam', config=AWS_CLIENT_CONFIG)
+        self.s3_client = session.client('s3', config=AWS_CLIENT_CONFIG)
+
+        # Initialize Kubernetes clients (one ApiClient so connections are pooled).
+        # Without cluster access they stay None and only the AWS metadata is collected.
+        self.k8s_api = None
+        self.core_v1 = None
+        self.batch_v1 = None
+        self.custom_objects = None
+
+        if self._load_k8s_config():
+            k8s_config = client.Configuration.get_default_copy()
+            k8s_config.connection_pool_maxsize = K8S_MAX_POOL_CONNECTIONS
+            self.k8s_api = client.ApiClient(k8s_config)
+            self.core_v1 = client.CoreV1Api(self.k8s_api)
+            self.batch_v1 = client.BatchV1Api(self.k8s_api)
+            self.custom_objects = client.CustomObjectsApi(self.k8s_api)
+
+        # Jobs keyed by UID, kept current by start_job_watch()
+        self._jobs_lock = threading.RLock()
+        self._jobs_cache: Dict[str, Dict[str, Any]] = {}
+        self._jobs_namespace: Optional[str] = None
+
+    @staticmethod
+    def _load_k8s_config() -> bool:
+        """Load in-cluster config when running as a pod, else the local kubeconfig"""
+        try:
+            config.load_incluster_config()
+            return True
+        except config.ConfigException:
+            pass
 
-        # Initialize AWS clients
-        self.eks_client = boto3.client('eks', region_name=region)
-        self.ec2_client = boto3.client('ec2', region_name=region)
-        self.efs_client = boto3.client('efs', region_name=region)
-        self.iam_client = boto3.client('iam', region_name=region)
-        self.s3_client = boto3.client('s3', region_name=region)
+        try:
+            config.load_kube_config()
+            return True
+        except config.ConfigException as e:
+            logger.warning(f"No Kubernetes config found, skipping cluster metadata: {e}")
+            return False
+
+    def start_job_watch(self, namespace: str = 'abinitio-prod'):
+        """Keep an in-memory job cache for a namespace current via a watch stream
+
+        Once started, collect_job_execution_history reads jobs for this
+        namespace from the cache instead of listing them from the API server.
+        """
+        if self.k8s_api is None:
+            logger.warning("Kubernetes API not configured, skipping job watch")
+            return
+
+        logger.info(f"Starting job watch for {namespace}...")
+
+        self._reconcile_jobs(namespace)
+        self._jobs_namespace = namespace
+
+        threading.Thread(target=self._watch_jobs, args=(namespace,), daemon=True).start()
+        threading.Thread(target=self._reconcile_jobs_periodically, args=(namespace,), daemon=True).start()
+
+    def _list_jobs(self, namespace: str) -> List[Dict[str, Any]]:
+        """List jobs in a namespace as raw JSON dicts, one page at a time"""
+        jobs = []
+        continue_token = None
+
+        while True:
+            # orjson is much faster than the client's model deserialization on large job lists
+            response = self.batch_v1.list_namespaced_job(
+                namespace,
+                limit=JOB_LIST_PAGE_SIZE,
+                _continue=continue_token,
+                _preload_content=False
+            )
+            page = orjson.loads(response.data)
+            jobs.extend(page.get('items', []))
+
+            continue_token = page.get('metadata', {}).get('continue')
+            if not continue_token:
+                return jobs
+
+    def _reconcile_jobs(self, namespace: str):
+        """Replace the job cache with a full listing"""
+        jobs = {job['metadata']['uid']: job for job in self._list_jobs(namespace)}
+
+        with self._jobs_lock:
+            self._jobs_cache = jobs
+
+    def _reconcile_jobs_periodically(self, namespace: str):
+        """Re-list jobs on a fixed interval so the cache self-heals"""
+        while True:
+            time.sleep(JOB_RECONCILE_INTERVAL_SECONDS)
+
+            try:
+                self._reconcile_jobs(namespace)
+            except Exception as e:
+                logger.warning(f"Error reconciling job cache: {e}")
+
+    def _watch_jobs(self, namespace: str):
+        """Apply job watch events to the cache, reopening the stream when it ends"""
+        while True:
+            try:
+                for event in watch.Watch().stream(self.batch_v1.list_namespaced_job, namespace):
+                    if event['type'] == 'ERROR':
+                        logger.warning(f"Job watch error: {event['raw_object'].get('message')}")
+                        time.sleep(JOB_WATCH_RETRY_SECONDS)
+                        break
+
+                    job = event['raw_object']
+                    with self._jobs_lock:
+                        if event['type'] == 'DELETED':
+                            self._jobs_cache.pop(job['metadata']['uid'], None)
+                        else:
+                            self._jobs_cache[job['metadata']['uid']] = job
+
+            except Exception as e:
+                logger.warning(f"Job watch interrupted: {e}")
+                time.sleep(JOB_WATCH_RETRY_SECONDS)
 
     def collect_eks_cluster_state(self) -> Dict[str, Any]:
         """Collect current EKS cluster state"""
@@ -50,69 +281,82 @@ class MetadataCollector:
 
         try:
             # Get cluster info
-            cluster_info = self.eks_client.describe_cluster(name=self.cluster_name)
-            cluster_state['cluster_version'] = cluster_info['cluster']['version']
-            cluster_state['cluster_arn'] = cluster_info['cluster']['arn']
+            cluster_info = self._get_cluster_info()
+            cluster_state['cluster_version'] = cluster_info['version']
+            cluster_state['cluster_arn'] = cluster_info['arn']
 
-            # Get node groups
+            # Get node groups and describe them concurrently
             node_groups = self.eks_client.list_nodegroups(clusterName=self.cluster_name)
 
-            for ng_name in node_groups.get('nodegroups', []):
-                ng_info = self.eks_client.describe_nodegroup(
-                    clusterName=self.cluster_name,
-                    nodegroupName=ng_name
+            with ThreadPoolExecutor(max_workers=EKS_DESCRIBE_WORKERS) as executor:
+                ng_infos = executor.map(
+                    lambda ng_name: self.eks_client.describe_nodegroup(
+                        clusterName=self.cluster_name,
+                        nodegroupName=ng_name
+                    ),
+                    node_groups.get('nodegroups', [])
                 )
 
-                ng_data = {
-                    'name': ng_name,
-                    'instance_types': ng_info['nodegroup']['instanceTypes'],
-                    'desired_size': ng_info['nodegroup']['scalingConfig']['desiredSize'],
-                    'min_size': ng_info['nodegroup']['scalingConfig']['minSize'],
-                    'max_size': ng_info['nodegroup']['scalingConfig']['maxSize']
-                }
+                for ng_info in ng_infos:
+                    ng_data = {
+                        'name': ng_info['nodegroup']['nodegroupName'],
+                        'instance_types': ng_info['nodegroup']['instanceTypes'],
+                        'desired_size': ng_info['nodegroup']['scalingConfig']['desiredSize'],
+                        'min_size': ng_info['nodegroup']['scalingConfig']['minSize'],
+                        'max_size': ng_info['nodegroup']['scalingConfig']['maxSize']
+                    }
 
-                cluster_state['node_groups'].append(ng_data)
+                    cluster_state['node_groups'].append(ng_data)
 
         except Exception as e:
             logger.error(f"Error collecting EKS state: {e}")
 
-        # Get resource availability from kubectl
+        if self.custom_objects is None:
+            logger.warning("Kubernetes API not configured, skipping node metrics")
+            return cluster_state
+
+        # Get resource usage from the metrics API (same data as `kubectl top nodes`)
         try:
-            result = subprocess.run(
-                ['kubectl', 'top', 'nodes', '--no-headers'],
-                capture_output=True,
-                text=True
+            node_metrics = self.custom_objects.list_cluster_custom_object(
+                'metrics.k8s.io', 'v1beta1', 'nodes'
             )
 
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                total_cpu = 0
-                total_memory = 0
-
-                for line in lines:
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        # Parse CPU (remove 'm' suffix)
-                        cpu = parts[1].replace('m', '')
-                        total_cpu += int(cpu) / 1000 if cpu.isdigit() else 0
-
-                        # Parse memory (remove 'Mi' or 'Gi' suffix)
-                        memory = parts[2]
-                        if 'Gi' in memory:
-                            total_memory += float(memory.replace('Gi', ''))
-                        elif 'Mi' in memory:
-                            total_memory += float(memory.replace('Mi', '')) / 1024
-
-                cluster_state['available_resources'] = {
-                    'total_cpu_cores': total_cpu,
-                    'total_memory_gi': total_memory
-                }
+            total_cpu = 0
+            total_memory = 0
+
+            for node in node_metrics.get('items', []):
+                usage = node.get('usage', {})
+
+                try:
+                    node_cpu = parse_quantity(usage.get('cpu', '0'))
+                    node_memory = parse_quantity(usage.get('memory', '0')) / (1024**3)
+                except ValueError as e:
+                    node_name = node.get('metadata', {}).get('name')
+                    logger.warning(f"Skipping metrics for node {node_name}: {e}")
+                    continue
+
+                total_cpu += node_cpu
+                total_memory += node_memory
+
+            cluster_state['available_resources'] = {
+                'total_cpu_cores': total_cpu,
+                'total_memory_gi': total_memory
+            }
 
         except Exception as e:
-            logger.error(f"Error getting kubectl metrics: {e}")
+            logger.error(f"Error getting node metrics: {e}")
 
         return cluster_state
 
+    @ttl_cache(CLUSTER_INFO_TTL_SECONDS)
+    def _get_cluster_info(self) -> Dict[str, str]:
+        """Get cluster version and ARN"""
+        response = self.eks_client.describe_cluster(name=self.cluster_name)
+        return {
+            'version': response['cluster']['version'],
+            'arn': response['cluster']['arn']
+        }
+
     def collect_storage_config(self) -> Dict[str, Any]:
         """Collect EFS and S3 configuration"""
         logger.info("Collecting storage configuration...")
@@ -124,66 +368,104 @@ class MetadataCollector:
         }
 
         try:
-            # Get EFS filesystems
-            efs_response = self.efs_client.describe_file_systems()
-
-            for fs in efs_response.get('FileSystems', []):
-                fs_data = {
-                    'filesystem_id': fs['FileSystemId'],
-                    'name': fs.get('Name', ''),
-                    'size_gb': fs['SizeInBytes']['Value'] / (1024**3),
-                    'performance_mode': fs['PerformanceMode'],
-                    'throughput_mode': fs.get('ThroughputMode', 'bursting'),
-                    'encrypted': fs['Encrypted']
-                }
-
-                # Get mount targets
-                mt_response = self.efs_client.describe_mount_targets(
-                    FileSystemId=fs['FileSystemId']
-                )
-                fs_data['mount_targets'] = len(mt_response.get('MountTargets', []))
-
-                storage_config['efs_filesystems'].append(fs_data)
+            # Get EFS filesystems and their mount targets concurrently;
+            # failed lookups come back as None
+            with ThreadPoolExecutor(max_workers=EFS_DESCRIBE_WORKERS) as executor:
+                for fs_data in executor.map(self._describe_file_system, self._get_file_systems()):
+                    if fs_data:
+                        storage_config['efs_filesystems'].append(fs_data)
 
         except Exception as e:
             logger.error(f"Error collecting EFS config: {e}")
 
         try:
-            # List S3 buckets (filter by prefix if needed)
-            buckets = self.s3_client.list_buckets()
-
-            for bucket in buckets.get('Buckets', []):
-                bucket_name = bucket['Name']
-
-                # Only include relevant buckets
-                if 'abinitio' in bucket_name.lower():
-                    try:
-                        # Get bucket location
-                        location = self.s3_client.get_bucket_location(Bucket=bucket_name)
-
-                        # Get encryption
-                        try:
-                            encryption = self.s3_client.get_bucket_encryption(Bucket=bucket_name)
-                            encrypted = True
-                        except:
-                            encrypted = False
-
-                        bucket_data = {
-                            'name': bucket_name,
-                            'region': location.get('LocationConstraint', 'us-east-1'),
-                            'encrypted': encrypted
-                        }
-
+            # List S3 buckets and filter by name before making any per-bucket calls
+            paginator = self.s3_client.get_paginator('list_buckets')
+            bucket_names = [
+                bucket['Name']
+                for page in paginator.paginate()
+                for bucket in page.get('Buckets', [])
+                if 'abinitio' in bucket['Name'].lower()
+            ]
+
+            # Describe buckets concurrently; failed lookups come back as None
+            with ThreadPoolExecutor(max_workers=S3_DESCRIBE_WORKERS) as executor:
+                for bucket_data in executor.map(self._describe_bucket, bucket_names):
+                    if bucket_data:
                         storage_config['s3_buckets'].append(bucket_data)
 
-                    except Exception as e:
-                        logger.warning(f"Error getting details for bucket {bucket_name}: {e}")
-
         except Exception as e:
             logger.error(f"Error collecting S3 config: {e}")
 
         return storage_config
 
+    def _get_file_systems(self) -> List[Dict[str, Any]]:
+        """Get EFS filesystem settings and current sizes"""
+        # Not cached: the modes arrive in the same response as the sizes and
+        # the set of filesystems, which must be current for the training data
+        paginator = self.efs_client.get_paginator('describe_file_systems')
+
+        return [
+            {
+                'filesystem_id': fs['FileSystemId'],
+                'name': fs.get('Name', ''),
+                'size_gb': fs['SizeInBytes']['Value'] / (1024**3),
+                'performance_mode': fs['PerformanceMode'],
+                'throughput_mode': fs.get('ThroughputMode', 'bursting'),
+                'encrypted': fs['Encrypted']
+            }
+            for page in paginator.paginate()
+            for fs in page.get('FileSystems', [])
+        ]
+
+    def _describe_file_system(self, fs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Add the mount target count to an EFS filesystem entry"""
+        fs_data = dict(fs)
+
+        try:
+            # Get mount targets
+            mt_response = self.efs_client.describe_mount_targets(
+                FileSystemId=fs['filesystem_id']
+            )
+            fs_data['mount_targets'] = len(mt_response.get('MountTargets', []))
+
+            return fs_data
+
+        except (ClientError, BotoCoreError) as e:
+            logger.warning(f"Error getting mount targets for {fs['filesystem_id']}: {e}")
+            return None
+
+    @ttl_cache(STATIC_METADATA_TTL_SECONDS)
+    def _get_bucket_region(self, bucket_name: str) -> str:
+        """Get the region of an S3 bucket"""
+        location = self.s3_client.get_bucket_location(Bucket=bucket_name)
+
+        # us-east-1 buckets report a null LocationConstraint
+        return location.get('LocationConstraint') or 'us-east-1'
+
+    def _describe_bucket(self, bucket_name: str) -> Optional[Dict[str, Any]]:
+        """Get location and encryption details for a single S3 bucket"""
+        try:
+            # Get bucket location
+            region = self._get_bucket_region(bucket_name)
+
+            # Get encryption
+            try:
+                self.s3_client.get_bucket_encryption(Bucket=bucket_name)
+                encrypted = True
+            except ClientError:
+                encrypted = False
+
+            return {
+                'name': bucket_name,
+                'region': region,
+                'encrypted': encrypted
+            }
+
+        except (ClientError, BotoCoreError) as e:
+            logger.warning(f"Error getting details for bucket {bucket_name}: {e}")
+            return None
+
     def collect_iam_config(self, service_account_name: str, namespace: str = 'abinitio-prod') -> Dict[str, Any]:
         """Collect IAM/IRSA configuration"""
         logger.info(f"Collecting IAM config for {namespace}/{service_account_name}...")
@@ -196,46 +478,49 @@ class MetadataCollector:
             'timestamp': datetime.utcnow().isoformat()
         }
 
-        try:
-            # Get ServiceAccount from kubectl
-            result = subprocess.run(
-                ['kubectl', 'get', 'serviceaccount', service_account_name,
-                 '-n', namespace, '-o', 'json'],
-                capture_output=True,
-                text=True
-            )
+        if self.core_v1 is None:
+            logger.warning("Kubernetes API not configured, skipping IAM config")
+            return iam_config
 
-            if result.returncode == 0:
-                sa_data = json.loads(result.stdout)
-                annotations = sa_data.get('metadata', {}).get('annotations', {})
-                iam_role_arn = annotations.get('eks.amazonaws.com/role-arn')
-
-                if iam_role_arn:
-                    iam_config['iam_role_arn'] = iam_role_arn
+        try:
+            # Get ServiceAccount from the Kubernetes API
+            sa = self.core_v1.read_namespaced_service_account(service_account_name, namespace)
+            annotations = sa.metadata.annotations or {}
+            iam_role_arn = annotations.get('eks.amazonaws.com/role-arn')
 
-                    # Get IAM role details
-                    role_name = iam_role_arn.split('/')[-1]
+            if iam_role_arn:
+                iam_config['iam_role_arn'] = iam_role_arn
 
-                    try:
-                        # List attached policies
-                        policies_response = self.iam_client.list_attached_role_policies(
-                            RoleName=role_name
-                        )
+                # Get IAM role details
+                role_name = iam_role_arn.split('/')[-1]
 
-                        for policy in policies_response.get('AttachedPolicies', []):
-                            iam_config['policies'].append({
-                                'name': policy['PolicyName'],
-                                'arn': policy['PolicyArn']
-                            })
+                try:
+                    # List attached policies
+                    iam_config['policies'] = self._get_role_policies(role_name)
 
-                    except Exception as e:
-                        logger.error(f"Error getting IAM policies: {e}")
+                except Exception as e:
+                    logger.error(f"Error getting IAM policies: {e}")
 
         except Exception as e:
             logger.error(f"Error collecting IAM config: {e}")
 
         return iam_config
 
+    @ttl_cache(STATIC_METADATA_TTL_SECONDS)
+    def _get_role_policies(self, role_name: str) -> List[Dict[str, str]]:
+        """Get the managed policies attached to an IAM role"""
+        policies_response = self.iam_client.list_attached_role_policies(
+            RoleName=role_name
+        )
+
+        return [
+            {
+                'name': policy['PolicyName'],
+                'arn': policy['PolicyArn']
+            }
+            for policy in policies_response.get('AttachedPolicies', [])
+        ]
+
     def collect_job_execution_history(
         self,
         namespace: str = 'abinitio-prod',
@@ -246,68 +531,90 @@ class MetadataCollector:
 
         history = []
 
-        try:
-            # Get completed jobs
-            result = subprocess.run(
-                ['kubectl', 'get', 'jobs', '-n', namespace, '-o', 'json'],
-                capture_output=True,
-                text=True
-            )
+        if self.batch_v1 is None:
+            logger.warning("Kubernetes API not configured, skipping job history")
+            return history
 
-            if result.returncode == 0:
-                jobs_data = json.loads(result.stdout)
+        # Jobs created before the cutoff are more than `days` whole days old.
+        # Kubernetes timestamps are fixed-width RFC 3339 UTC, so they can be
+        # compared as strings without parsing every one.
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days + 1)
+        cutoff_iso = cutoff.strftime('%Y-%m-%dT%H:%M:%SZ')
 
-                for job in jobs_data.get('items', []):
-                    job_name = job['metadata']['name']
-                    creation_time = job['metadata']['creationTimestamp']
+        try:
+            # Get completed jobs, from the watch cache when one is running
+            if namespace == self._jobs_namespace:
+                with self._jobs_lock:
+                    jobs = list(self._jobs_cache.values())
+            else:
+                jobs = self._list_jobs(namespace)
+
+            for job in jobs:
+                job_name = job['metadata']['name']
+                creation_time = job['metadata']['creationTimestamp']
+
+                # Check if within time window
+                if creation_time < cutoff_iso:
+                    continue
+
+                status = job.get('status', {})
+                succeeded = status.get('succeeded', 0)
+                failed = status.get('failed', 0)
+
+                # Get pod logs and events for more details
+                execution_data = {
+                    'job_name': job_name.rsplit('-', 1)[0],  # Remove hash suffix
+                    'execution_date': creation_time,
+                    'status': 'SUCCESS' if succeeded > 0 else 'FAILED' if failed > 0 else 'RUNNING',
+                    'duration_minutes': None,
+                    'resources_used': {},
+                    'failure_reason': None
+                }
 
-                    # Check if within time window
+                # Get completion time
+                completion_time = status.get('completionTime')
+                if completion_time:
                     created = datetime.fromisoformat(creation_time.replace('Z', '+00:00'))
-                    if (datetime.now(created.tzinfo) - created).days > days:
-                        continue
-
-                    status = job.get('status', {})
-                    succeeded = status.get('succeeded', 0)
-                    failed = status.get('failed', 0)
-
-                    # Get pod logs and events for more details
-                    execution_data = {
-                        'job_name': job_name.rsplit('-', 1)[0],  # Remove hash suffix
-                        'execution_date': creation_time,
-                        'status': 'SUCCESS' if succeeded > 0 else 'FAILED' if failed > 0 else 'RUNNING',
-                        'duration_minutes': None,
-                        'resources_used': {},
-                        'failure_reason': None
-                    }
-
-                    # Get completion time
-                    completion_time = status.get('completionTime')
-                    if completion_time:
-                        completed = datetime.fromisoformat(completion_time.replace('Z', '+00:00'))
-                        duration = (completed - created).total_seconds() / 60
-                        execution_data['duration_minutes'] = round(duration, 1)
+                    completed = datetime.fromisoformat(completion_time.replace('Z', '+00:00'))
+                    duration = (completed - created).total_seconds() / 60
+                    execution_data['duration_minutes'] = round(duration, 1)
 
-                    history.append(execution_data)
+                history.append(execution_data)
 
         except Exception as e:
             logger.error(f"Error collecting job history: {e}")
 
         return history
 
-    def save_metadata(self, output_file: str = 'collected_metadata.json'):
+    def save_metadata(self, output_file: str = 'collected_metadata.json', indent: bool = False):
         """Collect all metadata and save to file"""
         logger.info("Starting metadata collection...")
-
-        metadata = {
-            'collection_timestamp': datetime.utcnow().isoformat(),
-            'cluster_state': self.collect_eks_cluster_state(),
-            'storage_config': self.collect_storage_config(),
-            'iam_config': self.collect_iam_config('abinitio-batch-sa'),
-            'job_history': self.collect_job_execution_history()
-        }
-
-        with open(output_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        collection_timestamp = datetime.utcnow().isoformat()
+
+        # The collectors hit independent AWS/K8s endpoints, so run them concurrently.
+        # boto3 clients and the Kubernetes ApiClient are safe to share across threads.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            cluster_state = executor.submit(self.collect_eks_cluster_state)
+            storage_config = executor.submit(self.collect_storage_config)
+            iam_config = executor.submit(self.collect_iam_config, 'abinitio-batch-sa')
+            job_history = executor.submit(self.collect_job_execution_history)
+
+            metadata = {
+                'collection_timestamp': collection_timestamp,
+                'cluster_state': cluster_state.result(),
+                'storage_config': storage_config.result(),
+                'iam_config': iam_config.result(),
+                'job_history': job_history.result()
+            }
+
+        # Compact output keeps the training dataset small and fast to reload;
+        # indent only when a human is going to read the file
+        options = orjson.OPT_APPEND_NEWLINE
+        if indent:
+            options |= orjson.OPT_INDENT_2
+
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(metadata, option=options))
 
         logger.info(f"✓ Metadata saved to {output_file}")
         logger.info(f"  - Cluster state: {len(metadata['cluster_state']['node_groups'])} node groups")
@@ -325,11 +632,25 @@ def main():
     parser.add_argument('--region', default='us-east-1', help='AWS region')
     parser.add_argument('--output', default='collected_metadata.json', help='Output file')
     parser.add_argument('--days', type=int, default=30, help='Days of history to collect')
+    parser.add_argument('--indent', action='store_true', help='Pretty-print the output JSON')
+    parser.add_argument('--interval', type=int,
+                        help='Re-collect every N seconds, keeping a watch on jobs between runs')
 
     args = parser.parse_args()
 
-    collector = MetadataCollector(args.cluster, args.region)
-    collector.save_metadata(args.output)
+    # Keep the metadata cache next to the output so periodic runs share it
+    cache_file = Path(args.output).with_name('_cache.json')
+
+    collector = MetadataCollector(args.cluster, args.region, str(cache_file))
+
+    if not args.interval:
+        collector.save_metadata(args.output, indent=args.indent)
+        return
+
+    collector.start_job_watch()
+    while True:
+        collector.save_metadata(args.output, indent=args.indent)
+        time.sleep(args.interval)
 
 
 if __name__ == '__main__':
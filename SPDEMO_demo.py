@@ -13,10 +13,16 @@ Features:
 - JIRA ticket preview
 """
 
+import io
 import os
 import sys
 import json
+import asyncio
 import anthropic
+import httpx
+import numpy as np
+import orjson
+from collections import defaultdict, namedtuple
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from pathlib import Path
@@ -34,6 +40,116 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+# No color codes when output is piped or captured (CI, log files)
+USE_COLOR = sys.stdout.isatty()
+if not USE_COLOR:
+    for _name in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _name, '')
+
+
+# Fields of each historical execution kept in memory after loading
+HISTORY_FIELDS = (
+    'job_name', 'status', 'execution_date',
+    'failure_reason', 'error_details', 'resources_used'
+)
+
+# Per-job aggregates computed once when historical data is loaded
+JobHistorySummary = namedtuple('JobHistorySummary', [
+    'total_executions', 'success_count', 'failure_count',
+    'recent_failures', 'avg_memory', 'avg_cpu', 'avg_storage'
+])
+
+JSON_DECODER = json.JSONDecoder()
+
+# Historical failures sent to Claude per request, and how many of those
+# requests may be in flight at once (keeps clear of 429 rate limits)
+FAILURE_BATCH_SIZE = 50
+MAX_CONCURRENT_REQUESTS = 5
+
+# Output cap for each batch analysis and merge, and how many analyses are
+# combined per merge request; keeps every merge prompt near 20k tokens
+# however many failures there are
+FAILURE_ANALYSIS_MAX_TOKENS = 2048
+FAILURE_MERGE_GROUP_SIZE = 10
+
+# Job-independent prediction instructions, sent ahead of each job's data
+PREDICTION_INSTRUCTIONS = """You are an expert in predicting failures for Ab Initio jobs running on AWS EKS.
+
+Analyze the job configuration that follows, using the historical execution
+data and EKS cluster state provided with it, and predict potential failures.
+
+**Analysis Required:**
+
+Predict failures across these categories:
+1. **Pod Scheduling** - Will the pod be schedulable given current cluster resources?
+2. **EFS Mount** - Will EFS mount succeed?
+3. **Memory (OOMKill)** - Will the job exceed memory limits?
+4. **IAM Permissions** - Are required AWS permissions in place?
+5. **Data Quality** - Will duplicate data cause issues?
+
+For each category, provide:
+- **Probability** (0-100%)
+- **Severity** (LOW, MEDIUM, HIGH, CRITICAL)
+- **Root Cause** (why this failure might occur)
+- **Recommendations** (how to prevent it)
+
+Return your analysis as a JSON object with this structure:
+{
+  "predictions": {
+    "pod_scheduling": {
+      "probability": <number>,
+      "severity": "<string>",
+      "root_cause": "<string>",
+      "recommendations": ["<string>", ...]
+    },
+    "efs_mount": { ... },
+    "memory_oomkill": { ... },
+    "iam_permissions": { ... },
+    "data_quality": { ... }
+  },
+  "overall_assessment": {
+    "should_execute": <boolean>,
+    "overall_severity": "<string>",
+    "overall_probability": <number>,
+    "recommendation": "<string>"
+  },
+  "estimated_effort": {
+    "category": "SIMPLE|MEDIUM|COMPLEX|CRITICAL",
+    "story_points": <number>,
+    "estimated_hours": "<string>"
+  }
+}
+
+Provide only the JSON output, no additional text."""
+
+# Simplified cluster config used when config/eks_cluster_config.yaml is absent or unreadable
+DEFAULT_CLUSTER_CONFIG = {
+    'cluster_info': {
+        'cluster_name': 'bi-abi-apps-prod',
+        'region': 'us-east-1'
+    },
+    'node_groups': [{
+        'name': 'data-processing-ng',
+        'available_cpu': 20,
+        'available_memory_gi': 280
+    }]
+}
+
+
+def extract_json_object(text: str) -> Any:
+    """Decode the first valid JSON object in text, ignoring any surrounding prose or code fences"""
+    start = text.find('{')
+    while start != -1:
+        try:
+            obj, _ = JSON_DECODER.raw_decode(text, start)
+            return obj
+        except json.JSONDecodeError:
+            # A brace in the prose, not the start of the object; try the next one
+            start = text.find('{', start + 1)
+
+    raise json.JSONDecodeError("No JSON object found", text, 0)
+
+
 class EKSJobPredictor:
     """
     Interactive AI-powered job failure predictor
@@ -48,7 +164,14 @@ class EKSJobPredictor:
             print("Set it with: export ANTHROPIC_API_KEY='your-api-key'")
             sys.exit(1)
 
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        # One long-lived client; HTTP/2 keep-alive amortizes the TLS handshake across calls
+        self.client = anthropic.Anthropic(
+            api_key=self.api_key,
+            http_client=anthropic.DefaultHttpxClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=120.0)
+            )
+        )
 
         # Load demo data
         self.load_demo_data()
@@ -58,181 +181,232 @@ class EKSJobPredictor:
         base_path = Path(__file__).parent
 
         # Load historical job executions
-        history_file = base_path / 'SPDEMO_historical_job_data.json'
-        with open(history_file, 'r') as f:
-            self.historical_data = json.load(f)
+        self._history_file = base_path / 'SPDEMO_historical_job_data.json'
+        self._refresh_history()
 
         # Load sample job configurations
         config_file = base_path / 'SPDEMO_sample_job_configs.json'
         with open(config_file, 'r') as f:
             self.job_configs = json.load(f)
 
-        # Load EKS cluster state
+        # Load EKS cluster state (skip importing/parsing YAML when there is no file)
         cluster_file = base_path / 'config' / 'eks_cluster_config.yaml'
-        try:
-            import yaml
-            with open(cluster_file, 'r') as f:
-                self.cluster_config = yaml.safe_load(f)
-        except:
-            # Simplified cluster config if YAML load fails
-            self.cluster_config = {
-                'cluster_info': {
-                    'cluster_name': 'bi-abi-apps-prod',
-                    'region': 'us-east-1'
-                },
-                'node_groups': [{
-                    'name': 'data-processing-ng',
-                    'available_cpu': 20,
-                    'available_memory_gi': 280
-                }]
-            }
+        self.cluster_config = DEFAULT_CLUSTER_CONFIG
+        if cluster_file.exists():
+            try:
+                import yaml
+                loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+                with open(cluster_file, 'r') as f:
+                    self.cluster_config = yaml.load(f, Loader=loader)
+            except Exception:
+                # Keep the simplified cluster config if YAML load fails
+                pass
 
         print(f"{Colors.OKGREEN}✓ Loaded demo data successfully{Colors.ENDC}")
-        print(f"  - {len(self.historical_data['job_execution_history'])} historical executions")
+        print(f"  - {self._execution_count} historical executions")
         print(f"  - {len(self.job_configs['jobs'])} job configurations")
         print()
 
+    def _refresh_history(self):
+        """Rebuild everything derived from the historical data file
+
+        Nothing is replaced unless the whole file parses, and the mtime is
+        recorded last so a failed refresh is retried on the next prediction.
+        """
+        mtime = self._history_file.stat().st_mtime
+        self._build_history_index()
+        self._history_mtime = mtime
+
+    def _iter_historical_executions(self):
+        """Yield historical executions, streamed from the file when ijson is installed"""
+        with open(self._history_file, 'rb') as f:
+            try:
+                import ijson
+            except ImportError:
+                # Parse the whole document if streaming isn't available
+                yield from json.load(f)['job_execution_history']
+                return
+
+            yield from ijson.items(f, 'job_execution_history.item', use_float=True)
+
+    def _build_history_index(self):
+        """Index executions by job, by (job, status) and by failure, then summarize each job"""
+        # Built into locals and assigned together at the end, so a parse error
+        # partway through leaves the previous index untouched
+        by_job = defaultdict(list)
+        by_job_status = defaultdict(list)
+        all_failures = []
+        execution_count = 0
+        for record in self._iter_historical_executions():
+            # Keep only the fields the summaries and failure analysis read
+            execution = {field: record[field] for field in HISTORY_FIELDS if field in record}
+            execution_count += 1
+
+            by_job[execution['job_name']].append(execution)
+            by_job_status[(execution['job_name'], execution['status'])].append(execution)
+            if execution['status'] == 'FAILED':
+                all_failures.append(execution)
+
+        # Serialized once so failure analysis only has to join strings
+        failure_summaries_json = [
+            orjson.dumps({
+                'job': f['job_name'],
+                'date': f['execution_date'],
+                'reason': f['failure_reason'],
+                'details': f.get('error_details', {})
+            }).decode()
+            for f in all_failures
+        ]
+
+        job_summaries = {}
+        success_usage = {}
+        for job_name, job_history in by_job.items():
+            successes = by_job_status.get((job_name, 'SUCCESS'), [])
+            failures = by_job_status.get((job_name, 'FAILED'), [])
+
+            # Memory, CPU and storage of successful runs as one (N, 3) array
+            success_usage[job_name] = np.array([
+                [
+                    s['resources_used']['peak_memory_gb'],
+                    s['resources_used']['avg_cpu_cores'],
+                    s['resources_used']['storage_used_gb']
+                ]
+                for s in successes
+            ], dtype=np.float64).reshape(-1, 3)
+
+            avg_memory = avg_cpu = avg_storage = None
+            if successes:
+                avg_memory, avg_cpu, avg_storage = success_usage[job_name].mean(axis=0)
+
+            job_summaries[job_name] = JobHistorySummary(
+                total_executions=len(job_history),
+                success_count=len(successes),
+                failure_count=len(failures),
+                recent_failures=failures[:3],
+                avg_memory=avg_memory,
+                avg_cpu=avg_cpu,
+                avg_storage=avg_storage
+            )
+
+        self._by_job = by_job
+        self._by_job_status = by_job_status
+        self._failures = all_failures
+        self._execution_count = execution_count
+        self._failure_summaries_json = failure_summaries_json
+        self._job_summaries = job_summaries
+        self._success_usage = success_usage
+
     def display_menu(self):
         """Display interactive menu"""
-        print(f"\n{Colors.HEADER}{Colors.BOLD}=== AI-Powered EKS Job Failure Predictor ==={Colors.ENDC}\n")
-        print("Available Jobs:")
+        lines = [
+            f"\n{Colors.HEADER}{Colors.BOLD}=== AI-Powered EKS Job Failure Predictor ==={Colors.ENDC}\n",
+            "Available Jobs:"
+        ]
 
         for i, job in enumerate(self.job_configs['jobs'], 1):
-            print(f"  {i}. {job['job_name']}")
-            print(f"     {Colors.OKCYAN}{job['description']}{Colors.ENDC}")
-            print(f"     Schedule: {job['schedule']}")
-            print()
+            lines.append(f"  {i}. {job['job_name']}")
+            lines.append(f"     {Colors.OKCYAN}{job['description']}{Colors.ENDC}")
+            lines.append(f"     Schedule: {job['schedule']}")
+            lines.append("")
 
-        print(f"  {len(self.job_configs['jobs']) + 1}. Analyze Historical Failures")
-        print(f"  {len(self.job_configs['jobs']) + 2}. Exit")
-        print()
+        lines.append(f"  {len(self.job_configs['jobs']) + 1}. Analyze Historical Failures")
+        lines.append(f"  {len(self.job_configs['jobs']) + 2}. Exit")
+        lines.append("")
+
+        print("\n".join(lines))
 
     def get_historical_context(self, job_name: str) -> str:
         """Get historical execution context for a job"""
-        job_history = [
-            exec for exec in self.historical_data['job_execution_history']
-            if exec['job_name'] == job_name
-        ]
+        summary = self._job_summaries.get(job_name)
 
-        if not job_history:
+        if not summary:
             return "No historical data available"
 
-        successes = [e for e in job_history if e['status'] == 'SUCCESS']
-        failures = [e for e in job_history if e['status'] == 'FAILED']
-
         context = f"Historical Context for {job_name}:\n"
-        context += f"- Total executions: {len(job_history)}\n"
-        context += f"- Successes: {len(successes)}\n"
-        context += f"- Failures: {len(failures)}\n"
+        context += f"- Total executions: {summary.total_executions}\n"
+        context += f"- Successes: {summary.success_count}\n"
+        context += f"- Failures: {summary.failure_count}\n"
 
-        if failures:
+        if summary.recent_failures:
             context += "\nRecent Failures:\n"
-            for failure in failures[:3]:
+            for failure in summary.recent_failures:
                 context += f"  - {failure['execution_date']}: {failure['failure_reason']}\n"
 
-        if successes:
-            avg_memory = sum(s['resources_used']['peak_memory_gb'] for s in successes) / len(successes)
-            avg_cpu = sum(s['resources_used']['avg_cpu_cores'] for s in successes) / len(successes)
-            avg_storage = sum(s['resources_used']['storage_used_gb'] for s in successes) / len(successes)
-
+        if summary.success_count:
             context += f"\nAverage Resource Usage (Successful Runs):\n"
-            context += f"  - Memory: {avg_memory:.1f} GB\n"
-            context += f"  - CPU: {avg_cpu:.1f} cores\n"
-            context += f"  - Storage: {avg_storage:.1f} GB\n"
+            context += f"  - Memory: {summary.avg_memory:.1f} GB\n"
+            context += f"  - CPU: {summary.avg_cpu:.1f} cores\n"
+            context += f"  - Storage: {summary.avg_storage:.1f} GB\n"
 
         return context
 
-    def predict_with_claude(self, job_config: Dict[str, Any]) -> Dict[str, Any]:
-        """Use Claude API to predict job failures"""
-
-        job_name = job_config['job_name']
+    def _get_job_context(self, job_name: str) -> str:
+        """Get the historical data and cluster state sent with every prediction for a job"""
         historical_context = self.get_historical_context(job_name)
 
-        # Build comprehensive context for Claude
-        prompt = f"""You are an expert in predicting failures for Ab Initio jobs running on AWS EKS.
-
-Analyze this job configuration and predict potential failures:
-
-**Job Configuration:**
-```json
-{json.dumps(job_config, indent=2)}
-```
-
-**Historical Execution Data:**
+        return f"""**Historical Execution Data:**
 {historical_context}
 
 **EKS Cluster State:**
 - Available CPU: {self.cluster_config['node_groups'][0]['available_cpu']} cores
 - Available Memory: {self.cluster_config['node_groups'][0]['available_memory_gi']} GB
-- Cluster: {self.cluster_config['cluster_info']['cluster_name']}
-
-**Analysis Required:**
+- Cluster: {self.cluster_config['cluster_info']['cluster_name']}"""
 
-Predict failures across these categories:
-1. **Pod Scheduling** - Will the pod be schedulable given current cluster resources?
-2. **EFS Mount** - Will EFS mount succeed?
-3. **Memory (OOMKill)** - Will the job exceed memory limits?
-4. **IAM Permissions** - Are required AWS permissions in place?
-5. **Data Quality** - Will duplicate data cause issues?
+    def predict_with_claude(self, job_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Use Claude API to predict job failures"""
 
-For each category, provide:
-- **Probability** (0-100%)
-- **Severity** (LOW, MEDIUM, HIGH, CRITICAL)
-- **Root Cause** (why this failure might occur)
-- **Recommendations** (how to prevent it)
+        # Pick up changes to the historical data; a file caught mid-write keeps
+        # the previous history and is retried next time
+        if self._history_file.stat().st_mtime != self._history_mtime:
+            try:
+                self._refresh_history()
+            except Exception as e:
+                print(f"{Colors.WARNING}Could not reload historical data, using previous data: {e}{Colors.ENDC}")
 
-Return your analysis as a JSON object with this structure:
-{{
-  "predictions": {{
-    "pod_scheduling": {{
-      "probability": <number>,
-      "severity": "<string>",
-      "root_cause": "<string>",
-      "recommendations": ["<string>", ...]
-    }},
-    "efs_mount": {{ ... }},
-    "memory_oomkill": {{ ... }},
-    "iam_permissions": {{ ... }},
-    "data_quality": {{ ... }}
-  }},
-  "overall_assessment": {{
-    "should_execute": <boolean>,
-    "overall_severity": "<string>",
-    "overall_probability": <number>,
-    "recommendation": "<string>"
-  }},
-  "estimated_effort": {{
-    "category": "SIMPLE|MEDIUM|COMPLEX|CRITICAL",
-    "story_points": <number>,
-    "estimated_hours": "<string>"
-  }}
-}}
+        job_name = job_config['job_name']
 
-Provide only the JSON output, no additional text."""
+        # Shared instructions first, then the per-job data. Not marked for prompt
+        # caching: the prompt is under Claude 3.5 Sonnet's 1024-token minimum
+        content = [
+            {
+                "type": "text",
+                "text": PREDICTION_INSTRUCTIONS
+            },
+            {
+                "type": "text",
+                "text": self._get_job_context(job_name)
+            },
+            {
+                "type": "text",
+                "text": f"**Job Configuration:**\n```json\n{json.dumps(job_config, indent=2)}\n```"
+            }
+        ]
 
         print(f"{Colors.OKCYAN}🤖 Analyzing with Claude AI...{Colors.ENDC}")
 
         try:
-            message = self.client.messages.create(
+            # Stream the response so output starts appearing at the first token
+            response_chunks = []
+            with self.client.messages.stream(
                 model="claude-3-5-sonnet-20241022",
                 max_tokens=4096,
                 temperature=0.3,  # Lower temperature for more consistent predictions
                 messages=[
-                    {"role": "user", "content": prompt}
+                    {"role": "user", "content": content}
                 ]
-            )
+            ) as stream:
+                for text in stream.text_stream:
+                    response_chunks.append(text)
+                    sys.stdout.write(text)
+                    sys.stdout.flush()
+            print()
 
             # Extract JSON from response
-            response_text = message.content[0].text
-
-            # Try to parse JSON
-            # Sometimes Claude wraps JSON in markdown code blocks
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0]
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0]
+            response_text = "".join(response_chunks)
 
-            predictions = json.loads(response_text.strip())
+            # Parse the first JSON object, whether or not Claude wrapped it
+            # in a markdown code block
+            predictions = extract_json_object(response_text)
 
             return predictions
 
@@ -251,7 +425,10 @@ Provide only the JSON output, no additional text."""
             print(f"{Colors.FAIL}No predictions available{Colors.ENDC}")
             return
 
-        print(f"\n{Colors.HEADER}{Colors.BOLD}=== Prediction Results for {job_name} ==={Colors.ENDC}\n")
+        # Render into a buffer and write once instead of once per line
+        out = io.StringIO()
+
+        print(f"\n{Colors.HEADER}{Colors.BOLD}=== Prediction Results for {job_name} ==={Colors.ENDC}\n", file=out)
 
         # Overall Assessment
         overall = predictions.get('overall_assessment', {})
@@ -265,13 +442,13 @@ Provide only the JSON output, no additional text."""
             status_color = Colors.FAIL
             status_icon = "✗"
 
-        print(f"{status_color}{Colors.BOLD}{status_icon} Overall Decision: {'SAFE TO EXECUTE' if should_execute else 'DO NOT EXECUTE'}{Colors.ENDC}")
-        print(f"Severity: {self._severity_color(overall_severity)}{overall_severity}{Colors.ENDC}")
-        print(f"Recommendation: {overall.get('recommendation', 'N/A')}")
-        print()
+        print(f"{status_color}{Colors.BOLD}{status_icon} Overall Decision: {'SAFE TO EXECUTE' if should_execute else 'DO NOT EXECUTE'}{Colors.ENDC}", file=out)
+        print(f"Severity: {self._severity_color(overall_severity)}{overall_severity}{Colors.ENDC}", file=out)
+        print(f"Recommendation: {overall.get('recommendation', 'N/A')}", file=out)
+        print(file=out)
 
         # Individual Predictions
-        print(f"{Colors.BOLD}Detailed Analysis:{Colors.ENDC}\n")
+        print(f"{Colors.BOLD}Detailed Analysis:{Colors.ENDC}\n", file=out)
 
         pred_details = predictions.get('predictions', {})
 
@@ -279,26 +456,28 @@ Provide only the JSON output, no additional text."""
             probability = details.get('probability', 0)
             severity = details.get('severity', 'UNKNOWN')
 
-            print(f"{Colors.BOLD}{pred_type.replace('_', ' ').title()}{Colors.ENDC}")
-            print(f"  Probability: {self._prob_color(probability)}{probability}%{Colors.ENDC}")
-            print(f"  Severity: {self._severity_color(severity)}{severity}{Colors.ENDC}")
-            print(f"  Cause: {details.get('root_cause', 'N/A')}")
+            print(f"{Colors.BOLD}{pred_type.replace('_', ' ').title()}{Colors.ENDC}", file=out)
+            print(f"  Probability: {self._prob_color(probability)}{probability}%{Colors.ENDC}", file=out)
+            print(f"  Severity: {self._severity_color(severity)}{severity}{Colors.ENDC}", file=out)
+            print(f"  Cause: {details.get('root_cause', 'N/A')}", file=out)
 
             recommendations = details.get('recommendations', [])
             if recommendations:
-                print(f"  Recommendations:")
+                print(f"  Recommendations:", file=out)
                 for rec in recommendations:
-                    print(f"    • {rec}")
-            print()
+                    print(f"    • {rec}", file=out)
+            print(file=out)
 
         # Effort Estimation
         effort = predictions.get('estimated_effort', {})
         if effort:
-            print(f"{Colors.BOLD}Effort Estimation:{Colors.ENDC}")
-            print(f"  Category: {effort.get('category', 'N/A')}")
-            print(f"  Story Points: {effort.get('story_points', 'N/A')}")
-            print(f"  Estimated Hours: {effort.get('estimated_hours', 'N/A')}")
-            print()
+            print(f"{Colors.BOLD}Effort Estimation:{Colors.ENDC}", file=out)
+            print(f"  Category: {effort.get('category', 'N/A')}", file=out)
+            print(f"  Story Points: {effort.get('story_points', 'N/A')}", file=out)
+            print(f"  Estimated Hours: {effort.get('estimated_hours', 'N/A')}", file=out)
+            print(file=out)
+
+        sys.stdout.write(out.getvalue())
 
     def _prob_color(self, probability: float) -> str:
         """Get color based on probability"""
@@ -323,10 +502,7 @@ Provide only the JSON output, no additional text."""
         """Analyze historical failures with Claude"""
         print(f"\n{Colors.HEADER}{Colors.BOLD}=== Historical Failure Analysis ==={Colors.ENDC}\n")
 
-        failures = [
-            exec for exec in self.historical_data['job_execution_history']
-            if exec['status'] == 'FAILED'
-        ]
+        failures = self._failures
 
         if not failures:
             print("No failures found in historical data")
@@ -334,21 +510,50 @@ Provide only the JSON output, no additional text."""
 
         print(f"Found {len(failures)} failures. Analyzing patterns...\n")
 
-        # Build failure summary for Claude
-        failure_summary = []
-        for f in failures:
-            failure_summary.append({
-                'job': f['job_name'],
-                'date': f['execution_date'],
-                'reason': f['failure_reason'],
-                'details': f.get('error_details', {})
-            })
+        batches = [
+            self._failure_summaries_json[i:i + FAILURE_BATCH_SIZE]
+            for i in range(0, len(self._failure_summaries_json), FAILURE_BATCH_SIZE)
+        ]
+
+        print(f"{Colors.OKCYAN}🤖 Analyzing with Claude AI...{Colors.ENDC}\n")
+
+        try:
+            if len(batches) == 1:
+                prompt = self._failure_analysis_prompt(batches[0])
+            else:
+                # Analyze batches concurrently, then merge the partial analyses
+                print(f"Analyzing {len(batches)} batches of up to {FAILURE_BATCH_SIZE} failures...\n")
+                batch_analyses = asyncio.run(self._analyze_failure_batches(batches))
+
+                if not batch_analyses:
+                    print(f"{Colors.FAIL}No failure batches could be analyzed{Colors.ENDC}")
+                    return
+
+                prompt = self._failure_summary_prompt(batch_analyses)
+
+            with self.client.messages.stream(
+                model="claude-3-5-sonnet-20241022",
+                max_tokens=FAILURE_ANALYSIS_MAX_TOKENS,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            ) as stream:
+                for text in stream.text_stream:
+                    sys.stdout.write(text)
+                    sys.stdout.flush()
+            print()
+            print()
+
+        except Exception as e:
+            print(f"{Colors.FAIL}Error: {e}{Colors.ENDC}")
 
-        prompt = f"""Analyze these historical job failures and identify patterns:
+    def _failure_analysis_prompt(self, failure_summaries_json: List[str]) -> str:
+        """Build the pattern-analysis prompt for a list of pre-serialized failures"""
+        return f"""Analyze these historical job failures and identify patterns:
 
 **Historical Failures:**
 ```json
-{json.dumps(failure_summary, indent=2)}
+[{','.join(failure_summaries_json)}]
 ```
 
 Provide:
@@ -359,23 +564,68 @@ Provide:
 
 Format as a concise analysis."""
 
-        print(f"{Colors.OKCYAN}🤖 Analyzing with Claude AI...{Colors.ENDC}\n")
+    def _failure_summary_prompt(self, batch_analyses: List[str]) -> str:
+        """Build the prompt that merges per-batch failure analyses"""
+        analyses = "\n\n---\n\n".join(batch_analyses)
 
-        try:
-            message = self.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=2048,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+        return f"""These are analyses of separate batches of historical job failures:
+
+{analyses}
+
+Combine them into a single analysis. Provide:
+1. Common failure patterns
+2. Root cause categories
+3. Preventive measures
+4. Priority recommendations
+
+Format as a concise analysis."""
+
+    async def _analyze_failure_batches(self, batches: List[List[str]]) -> List[str]:
+        """Analyze failure batches concurrently, then merge the analyses in groups
+
+        At most MAX_CONCURRENT_REQUESTS calls are in flight at a time. Returns
+        no more than FAILURE_MERGE_GROUP_SIZE analyses for the final merge.
+        Failed calls are reported and skipped, so one bad batch doesn't discard
+        the rest.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async with anthropic.AsyncAnthropic(api_key=self.api_key) as aclient:
+            async def complete(prompt: str) -> str:
+                async with semaphore:
+                    message = await aclient.messages.create(
+                        model="claude-3-5-sonnet-20241022",
+                        max_tokens=FAILURE_ANALYSIS_MAX_TOKENS,
+                        messages=[
+                            {"role": "user", "content": prompt}
+                        ]
+                    )
+                    return message.content[0].text
+
+            async def complete_all(prompts: List[str], label: str) -> List[str]:
+                results = await asyncio.gather(*[complete(p) for p in prompts], return_exceptions=True)
+
+                for i, result in enumerate(results, 1):
+                    if isinstance(result, BaseException):
+                        print(f"{Colors.WARNING}{label} {i} of {len(prompts)} failed: {result}{Colors.ENDC}")
+
+                return [result for result in results if not isinstance(result, BaseException)]
+
+            analyses = await complete_all(
+                [self._failure_analysis_prompt(batch) for batch in batches], "Batch"
             )
 
-            analysis = message.content[0].text
-            print(analysis)
-            print()
+            # Merge in bounded groups until the rest fit in one merge prompt
+            while len(analyses) > FAILURE_MERGE_GROUP_SIZE:
+                groups = [
+                    analyses[i:i + FAILURE_MERGE_GROUP_SIZE]
+                    for i in range(0, len(analyses), FAILURE_MERGE_GROUP_SIZE)
+                ]
+                analyses = await complete_all(
+                    [self._failure_summary_prompt(group) for group in groups], "Merge"
+                )
 
-        except Exception as e:
-            print(f"{Colors.FAIL}Error: {e}{Colors.ENDC}")
+            return analyses
 
     def run_interactive_demo(self):
         """Run the interactive demo"""
@@ -437,8 +687,8 @@ Format as a concise analysis."""
             'predictions': predictions
         }
 
-        with open(filename, 'w') as f:
-            json.dump(output, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(output, option=orjson.OPT_APPEND_NEWLINE))
 
         print(f"{Colors.OKGREEN}✓ Saved to {filename}{Colors.ENDC}")
 